@@ -5,7 +5,20 @@ console output. This includes support for standard colors, the 256-color palette
 and 24-bit Truecolor (RGB) capabilities.
 """
 
-from .core import Kolyre
+from .core import (
+    Kolyre,
+    Stream,
+    background_256,
+    background_rgb,
+    colorize,
+    colorize_bytes,
+    enable_ansi_support,
+    foreground_256,
+    foreground_rgb,
+    invalidate_tty_cache,
+    refresh_tty,
+    stream,
+)
 
 __version__ = "2.0.0"
 __author__ = "DevBytAmir"
@@ -13,6 +26,17 @@ __license__ = "MIT"
 
 __all__ = [
     "Kolyre",
+    "Stream",
+    "background_256",
+    "background_rgb",
+    "colorize",
+    "colorize_bytes",
+    "enable_ansi_support",
+    "foreground_256",
+    "foreground_rgb",
+    "invalidate_tty_cache",
+    "refresh_tty",
+    "stream",
     "__version__",
     "__author__",
     "__license__",
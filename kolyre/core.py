@@ -1,12 +1,722 @@
-"""Kolyre class implementation for terminal text styling and coloring.
+"""Kolyre implementation for terminal text styling and coloring.
 
-This module contains the primary Kolyre class, including all ANSI escape code
-constants, color utilities (256-color and RGB), and Windows ANSI support
-functions.
+This module contains the color utilities (256-color and RGB), the `colorize()`
+helper and Windows ANSI support as module-level functions, along with the
+primary Kolyre class, which holds all ANSI escape code constants and exposes
+the same functions as static methods.
 """
 
 import sys
-from typing import Any, Final, final
+from collections.abc import Callable
+from functools import lru_cache
+from types import TracebackType
+from typing import Any, ClassVar, Final, TextIO, TypeVar, final
+
+# Windows console API constants used by `enable_ansi_support()`.
+_STD_OUTPUT_HANDLE: Final[int] = -11
+_ENABLE_VIRTUAL_TERMINAL_PROCESSING: Final[int] = 0x0004
+
+# Error message templates shared by the 256-color and RGB validators.
+_ERR_BOOLEAN: Final[str] = "{name} cannot be a boolean"
+_ERR_NOT_INT: Final[str] = "{name} must be an integer, got {type_name}"
+_ERR_OUT_OF_RANGE: Final[str] = "{name} must be between 0 and 255, got {value}"
+_ERR_HEX_LENGTH: Final[str] = "Hex color must be 6 characters (RRGGBB), got '{hex_str}'"
+_ERR_HEX_FORMAT: Final[str] = "Invalid hex color format: '{hex_str}'"
+_ERR_RGB_COUNT: Final[str] = "RGB sequence must have exactly 3 values, got {count}"
+_ERR_RGB_MISSING: Final[str] = (
+    "When providing a single integer, green and blue must also be provided"
+)
+_ERR_RGB_INPUT: Final[str] = (
+    "Invalid RGB input. Provide a hex string, (r, g, b), [r, g, b], or "
+    "three separate integers."
+)
+
+_RESET: Final[str] = sys.intern("\033[0m")
+_RESET_B: Final[bytes] = _RESET.encode("ascii")
+
+# Precomputed, interned 256-color escape codes, indexed by palette position.
+_FG256: Final[tuple[str, ...]] = tuple(
+    sys.intern(f"\033[38;5;{i}m") for i in range(256)
+)
+_BG256: Final[tuple[str, ...]] = tuple(
+    sys.intern(f"\033[48;5;{i}m") for i in range(256)
+)
+
+# Shorthand hex digit -> component value, e.g. "F" -> 0xFF.
+_HEX_SHORTHAND: Final[dict[str, int]] = {
+    digit: int(digit, 16) * 0x11 for digit in "0123456789abcdefABCDEF"
+}
+
+# Cached `isatty()` result and the stream it was resolved for.
+_IS_TTY: bool | None = None
+_TTY_STREAM: Any = None
+
+# Memoized result of `enable_ansi_support()`.
+_ANSI_SUPPORT_RESULT: bool | None = None
+
+
+def _flatten(item: str | tuple[Any, ...] | list[Any]) -> list[str]:
+    """Flatten nested ANSI codes into a flat list of strings.
+
+    Args:
+        item (str | tuple[Any, ...] | list[Any]): A string or nested lists/tuples
+            of ANSI codes.
+
+    Returns:
+        list[str]: A flat list of ANSI code strings.
+
+    Raises:
+        TypeError: If an element is not a string, list, or tuple.
+    """
+    # pylint: disable=C0123
+
+    flattened: list[str] = []
+    stack: list[str | tuple[Any, ...] | list[Any]] = [item]
+    while stack:
+        current = stack.pop()
+        # Exact type identity first; subclasses fall back to isinstance.
+        current_type = type(current)
+        if current_type is str:
+            flattened.append(current)  # type: ignore[arg-type]
+        elif current_type is list or current_type is tuple:
+            stack.extend(reversed(current))
+        elif isinstance(current, str):
+            flattened.append(current)
+        elif isinstance(current, (list, tuple)):
+            stack.extend(reversed(current))
+        else:
+            raise TypeError(
+                f"ANSI code must be a string, list, or tuple of strings, "
+                f"got {type(current).__name__}"
+            )
+
+    return flattened
+
+
+def _validate_256(color_index: int) -> int:
+    """Validate a 256-color index for ANSI escape codes.
+
+    Args:
+        color_index (int): The color index to validate.
+
+    Returns:
+        int: The validated color index.
+
+    Raises:
+        TypeError: If `color_index` is not an integer or is a boolean.
+        ValueError: If `color_index` is outside the range 0-255.
+    """
+    # pylint: disable=C0123
+
+    if type(color_index) is int:
+        if 0 <= color_index <= 255:
+            return color_index
+        raise ValueError(
+            _ERR_OUT_OF_RANGE.format(name="color_index", value=color_index)
+        )
+
+    if isinstance(color_index, bool):
+        raise TypeError(_ERR_BOOLEAN.format(name="color_index"))
+
+    if not isinstance(color_index, int):
+        raise TypeError(
+            _ERR_NOT_INT.format(
+                name="color_index", type_name=type(color_index).__name__
+            )
+        )
+
+    if not 0 <= color_index <= 255:
+        raise ValueError(
+            _ERR_OUT_OF_RANGE.format(name="color_index", value=color_index)
+        )
+
+    return color_index
+
+
+@lru_cache(maxsize=512)
+def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
+    """Parse and cache a hex color string.
+
+    Args:
+        hex_color (str): A hex color such as '#FF8800', 'CC33AA' or 'F80'.
+
+    Returns:
+        tuple[int, int, int]: The (red, green, blue) components.
+
+    Raises:
+        ValueError: If the string is not 3 or 6 hexadecimal digits long, or
+            contains non-hexadecimal characters.
+    """
+    hex_str = hex_color.strip().lstrip("#")
+    if len(hex_str) == 3:
+        red = _HEX_SHORTHAND.get(hex_str[0], -1)
+        green = _HEX_SHORTHAND.get(hex_str[1], -1)
+        blue = _HEX_SHORTHAND.get(hex_str[2], -1)
+        if (red | green | blue) >= 0:
+            return red, green, blue
+        # Expand invalid shorthand so it is reported like the long form.
+        hex_str = hex_str[0] * 2 + hex_str[1] * 2 + hex_str[2] * 2
+    if len(hex_str) != 6:
+        raise ValueError(_ERR_HEX_LENGTH.format(hex_str=hex_str))
+    try:
+        components = bytes.fromhex(hex_str)
+    except ValueError as exc:
+        raise ValueError(_ERR_HEX_FORMAT.format(hex_str=hex_str)) from exc
+    if len(components) != 3:
+        raise ValueError(_ERR_HEX_FORMAT.format(hex_str=hex_str))
+
+    red, green, blue = components
+    return red, green, blue
+
+
+def _validate_rgb_components(red: Any, green: Any, blue: Any) -> tuple[int, int, int]:
+    """Validate the three components of an RGB color.
+
+    Args:
+        red: The red component.
+        green: The green component.
+        blue: The blue component.
+
+    Returns:
+        tuple[int, int, int]: The validated (red, green, blue) tuple.
+
+    Raises:
+        TypeError: If any component is not an integer or is a boolean.
+        ValueError: If any component is outside the 0-255 range.
+    """
+    # pylint: disable=C0123
+
+    # Fast path: exact ints whose OR has no bits above 0xFF. Negative values
+    # keep their sign under the shift, so they fail the test as well.
+    if type(red) is int and type(green) is int and type(blue) is int:
+        if not (red | green | blue) >> 8:
+            return red, green, blue
+
+    for name, value in zip(("red", "green", "blue"), (red, green, blue)):
+        if isinstance(value, bool):
+            raise TypeError(_ERR_BOOLEAN.format(name=name))
+        if not isinstance(value, int):
+            raise TypeError(
+                _ERR_NOT_INT.format(name=name, type_name=type(value).__name__)
+            )
+        if not 0 <= value <= 255:
+            raise ValueError(_ERR_OUT_OF_RANGE.format(name=name, value=value))
+
+    return red, green, blue
+
+
+def _rgb_from_hex(
+    rgb: Any, _green: int | None, _blue: int | None
+) -> tuple[int, int, int]:
+    """Handle a hex string RGB input. See `_normalize_rgb()`."""
+    return _hex_to_rgb(rgb)
+
+
+def _rgb_from_sequence(
+    rgb: Any, _green: int | None, _blue: int | None
+) -> tuple[int, int, int]:
+    """Handle a tuple or list RGB input. See `_normalize_rgb()`."""
+    if len(rgb) != 3:
+        raise ValueError(_ERR_RGB_COUNT.format(count=len(rgb)))
+    return _validate_rgb_components(*rgb)
+
+
+def _rgb_from_ints(
+    rgb: Any, green: int | None, blue: int | None
+) -> tuple[int, int, int]:
+    """Handle three separate integer RGB components. See `_normalize_rgb()`."""
+    if green is None or blue is None:
+        raise ValueError(_ERR_RGB_MISSING)
+    return _validate_rgb_components(rgb, green, blue)
+
+
+_RgbHandler = Callable[[Any, int | None, int | None], tuple[int, int, int]]
+
+# Exact-type dispatch for `_normalize_rgb()`; subclasses such as named tuples or
+# booleans fall back to the isinstance checks.
+_RGB_HANDLERS: Final[dict[type, _RgbHandler]] = {
+    str: _rgb_from_hex,
+    tuple: _rgb_from_sequence,
+    list: _rgb_from_sequence,
+    int: _rgb_from_ints,
+}
+
+
+def _normalize_rgb(
+    rgb: str | tuple[int, int, int] | list[int] | int,
+    green: int | None,
+    blue: int | None,
+) -> tuple[int, int, int]:
+    """Internal helper to parse and validate RGB input formats.
+
+    Args:
+        rgb: The red component (0-255). This can also be a hex string (e.g.,
+            '#FF8800' or 'F80'), or a sequence (tuple/list) of three integers
+            (R, G, B).
+        green: The green component (0-255) if rgb is a single integer.
+        blue: The blue component (0-255) if rgb is a single integer.
+
+    Returns:
+        tuple[int, int, int]: A validated (red, green, blue) tuple of integers
+            from 0 to 255.
+
+    Raises:
+        ValueError: If any component is outside the 0-255 range, a hex string is
+            malformed, or a sequence doesn't contain exactly three values.
+        TypeError: If any component is not an integer or is a boolean, or if
+            the input type is invalid.
+    """
+    handler: _RgbHandler | None = _RGB_HANDLERS.get(type(rgb))
+    if handler is None:
+        if isinstance(rgb, str):
+            handler = _rgb_from_hex
+        elif isinstance(rgb, (tuple, list)):
+            handler = _rgb_from_sequence
+        elif isinstance(rgb, int):
+            handler = _rgb_from_ints
+        else:
+            raise TypeError(_ERR_RGB_INPUT)
+
+    return handler(rgb, green, blue)
+
+
+@lru_cache(maxsize=4096)
+def _rgb_escape(prefix: int, red: int, green: int, blue: int) -> str:
+    """Build and cache a truecolor ANSI escape code.
+
+    Args:
+        prefix (int): SGR selector, 38 for foreground or 48 for background.
+        red (int): Validated red component (0-255).
+        green (int): Validated green component (0-255).
+        blue (int): Validated blue component (0-255).
+
+    Returns:
+        str: The ANSI escape sequence for the given color.
+    """
+    return f"\033[{prefix};2;{red};{green};{blue}m"
+
+
+def _resolve_tty() -> bool:
+    """Return whether `sys.stdout` is a TTY, caching the result.
+
+    The cached value is reused for as long as `sys.stdout` refers to the
+    same stream object, so redirecting stdout re-evaluates it.
+
+    Returns:
+        bool: True if `sys.stdout` is attached to a terminal.
+    """
+    global _IS_TTY, _TTY_STREAM  # pylint: disable=W0603
+
+    stdout = sys.stdout
+    if _IS_TTY is None or _TTY_STREAM is not stdout:
+        _IS_TTY = stdout.isatty()
+        _TTY_STREAM = stdout
+    return _IS_TTY
+
+
+def _color_enabled(force: bool | None) -> bool:
+    """Return whether styling should be applied.
+
+    Args:
+        force (bool | None): The `force` argument of the styling call. If None,
+            `Kolyre.FORCE_COLOR` is used as the override.
+
+    Returns:
+        bool: True if styling is forced or `sys.stdout` is a TTY.
+    """
+    return (force if force is not None else Kolyre.FORCE_COLOR) or _resolve_tty()
+
+
+def _join_codes(ansi_codes: tuple[str | tuple[Any, ...] | list[Any], ...]) -> str:
+    """Flatten and concatenate ANSI codes into a single prefix string.
+
+    Args:
+        ansi_codes (tuple[str | tuple[Any, ...] | list[Any], ...]): ANSI codes,
+            individually or nested in lists/tuples.
+
+    Returns:
+        str: The concatenated ANSI codes.
+
+    Raises:
+        TypeError: If any provided ANSI code is not a `str`.
+    """
+    try:
+        # Fast path for the common case of plain, non-nested codes.
+        return "".join(ansi_codes)  # type: ignore[arg-type]
+    except TypeError:
+        return "".join(_flatten(ansi_codes))
+
+
+def colorize(
+    text: str,
+    *ansi_codes: str | tuple[Any, ...] | list[Any],
+    force: bool | None = None,
+) -> str:
+    """Apply one or more ANSI codes to the given text.
+
+    Args:
+        text (str): The text to style.
+        *ansi_codes (str | tuple[Any, ...] | list[Any]): One or more ANSI codes,
+            individually or nested in lists/tuples.
+        force (bool, optional): If True, forces styling regardless of TTY or
+            Kolyre.FORCE_COLOR setting. If None, the class-level Kolyre.FORCE_COLOR
+            is used as the override. Defaults to None.
+
+    Returns:
+        str: The styled text, reset with `Kolyre.RESET`.
+
+    Raises:
+        TypeError: If `text` is not a `str`, or if any provided ANSI code
+            is not a `str`.
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"text must be a string, got {type(text).__name__}")
+    if not ansi_codes:
+        return text
+
+    prefix = _join_codes(ansi_codes)
+    if not prefix or not _color_enabled(force):
+        return text
+
+    return f"{prefix}{text}{_RESET}"
+
+
+def colorize_bytes(text: bytes, *ansi_codes: bytes, force: bool | None = None) -> bytes:
+    """Apply one or more pre-encoded ANSI codes to the given bytes.
+
+    The bytes counterpart of `colorize()` for writers that emit directly to a
+    binary stream, typically combined with the `*_B` constants (e.g.
+    `Kolyre.Style.BOLD_B`). Nested sequences of codes are not supported.
+
+    Args:
+        text (bytes): The encoded text to style.
+        *ansi_codes (bytes): One or more encoded ANSI codes.
+        force (bool, optional): If True, forces styling regardless of TTY or
+            Kolyre.FORCE_COLOR setting. If None, the class-level Kolyre.FORCE_COLOR
+            is used as the override. Defaults to None.
+
+    Returns:
+        bytes: The styled text, reset with `Kolyre.Style.RESET_B`.
+
+    Raises:
+        TypeError: If `text` or any provided ANSI code is not `bytes`.
+    """
+    if not isinstance(text, bytes):
+        raise TypeError(f"text must be bytes, got {type(text).__name__}")
+    for code in ansi_codes:
+        if not isinstance(code, bytes):
+            raise TypeError(f"ANSI code must be bytes, got {type(code).__name__}")
+
+    prefix = b"".join(ansi_codes)
+    if not prefix or not _color_enabled(force):
+        return text
+
+    return prefix + text + _RESET_B
+
+
+def invalidate_tty_cache() -> None:
+    """Discard the cached TTY state used by `colorize()`.
+
+    Replacing `sys.stdout` is detected automatically; call this only when
+    the TTY state of the current stream may have changed.
+    """
+    global _IS_TTY, _TTY_STREAM  # pylint: disable=W0603
+
+    _IS_TTY = None
+    _TTY_STREAM = None
+
+
+def refresh_tty() -> bool:
+    """Re-evaluate and cache whether `sys.stdout` is a TTY.
+
+    Useful after the terminal state of the current stream has changed, so the
+    next `colorize()` call does not have to query it.
+
+    Returns:
+        bool: True if `sys.stdout` is attached to a terminal.
+    """
+    invalidate_tty_cache()
+    return _resolve_tty()
+
+
+def foreground_256(color_index: int) -> str:
+    """Return a 256-color ANSI escape code for the foreground.
+
+    Args:
+        color_index (int): Integer between 0 and 255, representing a color
+            in the ANSI 256-color palette.
+
+    Returns:
+        str: ANSI escape sequence for the specified foreground color.
+
+    Raises:
+        TypeError: If `color_index` is not an integer or is a boolean.
+        ValueError: If `color_index` is outside the range 0-255.
+    """
+    if type(color_index) is int and 0 <= color_index <= 255:  # pylint: disable=C0123
+        return _FG256[color_index]
+    return _FG256[_validate_256(color_index)]
+
+
+def background_256(color_index: int) -> str:
+    """Return a 256-color ANSI escape code for the background.
+
+    Args:
+        color_index (int): Integer between 0 and 255, representing a color
+            in the ANSI 256-color palette.
+
+    Returns:
+        str: ANSI escape sequence for the specified background color.
+
+    Raises:
+        TypeError: If `color_index` is not an integer or is a boolean.
+        ValueError: If `color_index` is outside the range 0-255.
+    """
+    if type(color_index) is int and 0 <= color_index <= 255:  # pylint: disable=C0123
+        return _BG256[color_index]
+    return _BG256[_validate_256(color_index)]
+
+
+def foreground_rgb(
+    rgb: str | tuple[int, int, int] | list[int] | int,
+    green: int | None = None,
+    blue: int | None = None,
+) -> str:
+    """Return a truecolor (24-bit RGB) ANSI escape code for the foreground.
+
+    Args:
+        rgb (str, tuple, list, or int):
+            - Hex string (e.g., "#FF8800", "CC33AA", or shorthand "F80")
+            - Tuple or list of three integers (R, G, B)
+            - Single red integer if `green` and `blue` are provided
+        green (int, optional): Green value if `rgb` is a single int.
+        blue (int, optional): Blue value if `rgb` is a single int.
+
+    Returns:
+        str: ANSI escape sequence for the specified RGB foreground color.
+
+    Raises:
+        TypeError: If any component is not an integer or is a boolean.
+        ValueError: If any RGB component is outside 0-255, or if the input
+            is malformed.
+    """
+    red, green, blue = _normalize_rgb(rgb, green, blue)
+    return _rgb_escape(38, red, green, blue)
+
+
+def background_rgb(
+    rgb: str | tuple[int, int, int] | list[int] | int,
+    green: int | None = None,
+    blue: int | None = None,
+) -> str:
+    """Return a truecolor (24-bit RGB) ANSI escape code for the background.
+
+    Args:
+        rgb (str, tuple, list, or int):
+            - Hex string (e.g., "#FF8800", "CC33AA", or shorthand "F80")
+            - Tuple or list of three integers (R, G, B)
+            - Single red integer if `green` and `blue` are provided
+        green (int, optional): Green value if `rgb` is a single int.
+        blue (int, optional): Blue value if `rgb` is a single int.
+
+    Returns:
+        str: ANSI escape sequence for the specified RGB background color.
+
+    Raises:
+        TypeError: If any component is not an integer or is a boolean.
+        ValueError: If any RGB component is outside 0-255, or if the input
+            is malformed.
+    """
+    red, green, blue = _normalize_rgb(rgb, green, blue)
+    return _rgb_escape(48, red, green, blue)
+
+
+def enable_ansi_support(force_refresh: bool = False) -> bool:
+    """Enable ANSI escape sequences on Windows terminals.
+
+    The outcome of the first call is memoized, so later calls return without
+    touching the console API.
+
+    Args:
+        force_refresh (bool, optional): If True, ignore the memoized result and
+            query the console again. Defaults to False.
+
+    Returns:
+        bool: True if ANSI support is active or not needed; False if
+            enabling failed.
+    """
+    global _ANSI_SUPPORT_RESULT  # pylint: disable=W0603
+
+    if _ANSI_SUPPORT_RESULT is None or force_refresh:
+        _ANSI_SUPPORT_RESULT = _enable_ansi_support()
+    return _ANSI_SUPPORT_RESULT
+
+
+def _enable_ansi_support() -> bool:
+    """Enable ANSI support without memoization. See `enable_ansi_support()`."""
+    # pylint: disable=R0911
+    if sys.platform != "win32":
+        return True
+
+    try:
+        # pylint: disable=C0415
+        import ctypes
+    except ImportError:
+        return False
+
+    try:
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(_STD_OUTPUT_HANDLE)
+        if handle in (0, -1):
+            return False
+
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+
+        if not kernel32.SetConsoleMode(
+            handle, mode.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        ):
+            return False
+    except (AttributeError, OSError):
+        return False
+
+    return True
+
+
+@final
+class Stream:
+    """Buffer styled fragments and write them to a stream in a single call.
+
+    Use it as a context manager: fragments added with `write()` are collected
+    and written to the underlying stream when the block exits. Whether styling
+    is applied depends on the TTY state of that stream, not of `sys.stdout`.
+
+    Example:
+        with Kolyre.stream(sys.stderr) as out:
+            out.write("error: ", Kolyre.Style.BOLD, Kolyre.Foreground.RED)
+            out.write("file not found")
+    """
+
+    __slots__ = ("_buffer", "_is_tty", "_writer")
+
+    def __init__(self, writer: TextIO) -> None:
+        """Initialize an empty buffer for `writer`.
+
+        Args:
+            writer (TextIO): The text stream the buffered output is written to.
+                Writers without an `isatty()` method are treated as non-TTY.
+        """
+        self._buffer: list[str] = []
+        self._writer = writer
+        isatty = getattr(writer, "isatty", None)
+        self._is_tty = bool(isatty()) if callable(isatty) else False
+
+    def write(
+        self,
+        text: str,
+        *ansi_codes: str | tuple[Any, ...] | list[Any],
+        force: bool | None = None,
+    ) -> None:
+        """Buffer `text` styled with the given codes. See `colorize()`.
+
+        Args:
+            text (str): The text to style.
+            *ansi_codes (str | tuple[Any, ...] | list[Any]): One or more ANSI
+                codes, individually or nested in lists/tuples.
+            force (bool, optional): If True, forces styling regardless of the
+                writer's TTY state or Kolyre.FORCE_COLOR setting. If None, the
+                class-level Kolyre.FORCE_COLOR is used as the override.
+                Defaults to None.
+
+        Raises:
+            TypeError: If `text` is not a `str`, or if any provided ANSI code
+                is not a `str`.
+        """
+        if not isinstance(text, str):
+            raise TypeError(f"text must be a string, got {type(text).__name__}")
+
+        prefix = _join_codes(ansi_codes) if ansi_codes else ""
+        enabled = (force if force is not None else Kolyre.FORCE_COLOR) or self._is_tty
+        if prefix and enabled:
+            self._buffer.append(f"{prefix}{text}{_RESET}")
+        else:
+            self._buffer.append(text)
+
+    def flush(self) -> None:
+        """Write the buffered fragments to the stream and clear the buffer."""
+        if self._buffer:
+            self._writer.write("".join(self._buffer))
+            self._buffer.clear()
+
+    def __enter__(self) -> "Stream":
+        """Return the stream itself for use in a `with` block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Flush the buffered fragments when the `with` block exits."""
+        self.flush()
+
+
+def stream(writer: TextIO) -> Stream:
+    """Return a `Stream` that batches styled writes to `writer`.
+
+    Args:
+        writer (TextIO): The text stream the buffered output is written to.
+
+    Returns:
+        Stream: A context manager collecting styled fragments.
+    """
+    return Stream(writer)
+
+
+_ConstClass = TypeVar("_ConstClass", bound=type)
+
+
+def _collect_constants(const_class: _ConstClass) -> _ConstClass:
+    """Record the public string constants of a class in `_ENTRIES`.
+
+    Constants are collected in declaration order and replaced with their
+    interned copies.
+
+    Args:
+        const_class: A class declaring its constants as public `str` attributes.
+
+    Returns:
+        The same class, with its constants interned and listed in `_ENTRIES`.
+    """
+    entries = tuple(
+        (name, sys.intern(value))
+        for name, value in vars(const_class).items()
+        if not name.startswith("_") and isinstance(value, str)
+    )
+    for name, code in entries:
+        setattr(const_class, name, code)
+    setattr(const_class, "_ENTRIES", entries)
+    return const_class
+
+
+def _add_bytes_constants(const_class: _ConstClass) -> _ConstClass:
+    """Add an ASCII-encoded `<NAME>_B` twin for every entry of a constant class.
+
+    The twins are declared in the class body as `ClassVar[bytes]` annotations
+    so type checkers see them; this decorator assigns their values.
+
+    Args:
+        const_class: A class declaring its constants in `_ENTRIES`.
+
+    Returns:
+        The same class, with the `bytes` constants attached.
+    """
+    entries: tuple[tuple[str, str], ...] = getattr(const_class, "_ENTRIES")
+    for name, code in entries:
+        setattr(const_class, f"{name}_B", code.encode("ascii"))
+    return const_class
 
 
 @final
@@ -18,11 +728,13 @@ class Kolyre:
     `enable_ansi_support()` can help display ANSI codes correctly on some
     Windows terminals.
 
-    Truecolor support may vary depending on the terminal.
+    Truecolor support may vary depending on the terminal. The methods are
+    static aliases of the module-level functions of the same name.
 
     Attributes:
         FORCE_COLOR (bool): If True, forces ANSI codes to be returned even if
-            `sys.stdout.isatty()` is False. Defaults to False.
+            `sys.stdout.isatty()` is False. Defaults to False. The `isatty()`
+            result is cached per stream; see `invalidate_tty_cache()`.
         Style: Nested class containing constants for text styles
             (e.g., BOLD, UNDERLINE).
         Foreground: Nested class containing constants for standard
@@ -31,13 +743,19 @@ class Kolyre:
             (8/16-bit) background colors.
     """
 
+    # pylint: disable=R0903
+
     FORCE_COLOR: bool = False
 
+    @_add_bytes_constants
+    @_collect_constants
     class Style:
         """ANSI escape codes for text styling in the terminal."""
 
         # pylint: disable=R0903
 
+        _ENTRIES: ClassVar[tuple[tuple[str, str], ...]]
+
         BOLD: Final[str] = "\033[1m"
         DIM: Final[str] = "\033[2m"
         ITALIC: Final[str] = "\033[3m"
@@ -48,7 +766,7 @@ class Kolyre:
         STRIKETHROUGH: Final[str] = "\033[9m"
         OVERLINE: Final[str] = "\033[53m"
 
-        RESET: Final[str] = "\033[0m"
+        RESET: Final[str] = _RESET
 
         RESET_BOLD_DIM: Final[str] = "\033[22m"
         RESET_ITALIC: Final[str] = "\033[23m"
@@ -61,11 +779,39 @@ class Kolyre:
         RESET_FOREGROUND: Final[str] = "\033[39m"
         RESET_BACKGROUND: Final[str] = "\033[49m"
 
+        # ASCII-encoded twins, attached by `_add_bytes_constants()`.
+        BOLD_B: ClassVar[bytes]
+        DIM_B: ClassVar[bytes]
+        ITALIC_B: ClassVar[bytes]
+        UNDERLINE_B: ClassVar[bytes]
+        DOUBLE_UNDERLINE_B: ClassVar[bytes]
+        REVERSED_B: ClassVar[bytes]
+        HIDDEN_B: ClassVar[bytes]
+        STRIKETHROUGH_B: ClassVar[bytes]
+        OVERLINE_B: ClassVar[bytes]
+
+        RESET_B: ClassVar[bytes]
+
+        RESET_BOLD_DIM_B: ClassVar[bytes]
+        RESET_ITALIC_B: ClassVar[bytes]
+        RESET_UNDERLINE_B: ClassVar[bytes]
+        RESET_REVERSED_B: ClassVar[bytes]
+        RESET_HIDDEN_B: ClassVar[bytes]
+        RESET_STRIKETHROUGH_B: ClassVar[bytes]
+        RESET_OVERLINE_B: ClassVar[bytes]
+
+        RESET_FOREGROUND_B: ClassVar[bytes]
+        RESET_BACKGROUND_B: ClassVar[bytes]
+
+    @_add_bytes_constants
+    @_collect_constants
     class Foreground:
         """ANSI escape codes for foreground colors."""
 
         # pylint: disable=R0903
 
+        _ENTRIES: ClassVar[tuple[tuple[str, str], ...]]
+
         BLACK: Final[str] = "\033[30m"
         RED: Final[str] = "\033[31m"
         GREEN: Final[str] = "\033[32m"
@@ -84,11 +830,34 @@ class Kolyre:
         BRIGHT_CYAN: Final[str] = "\033[96m"
         BRIGHT_WHITE: Final[str] = "\033[97m"
 
+        # ASCII-encoded twins, attached by `_add_bytes_constants()`.
+        BLACK_B: ClassVar[bytes]
+        RED_B: ClassVar[bytes]
+        GREEN_B: ClassVar[bytes]
+        YELLOW_B: ClassVar[bytes]
+        BLUE_B: ClassVar[bytes]
+        MAGENTA_B: ClassVar[bytes]
+        CYAN_B: ClassVar[bytes]
+        WHITE_B: ClassVar[bytes]
+
+        BRIGHT_BLACK_B: ClassVar[bytes]
+        BRIGHT_RED_B: ClassVar[bytes]
+        BRIGHT_GREEN_B: ClassVar[bytes]
+        BRIGHT_YELLOW_B: ClassVar[bytes]
+        BRIGHT_BLUE_B: ClassVar[bytes]
+        BRIGHT_MAGENTA_B: ClassVar[bytes]
+        BRIGHT_CYAN_B: ClassVar[bytes]
+        BRIGHT_WHITE_B: ClassVar[bytes]
+
+    @_add_bytes_constants
+    @_collect_constants
     class Background:
         """ANSI escape codes for background colors."""
 
         # pylint: disable=R0903
 
+        _ENTRIES: ClassVar[tuple[tuple[str, str], ...]]
+
         BLACK: Final[str] = "\033[40m"
         RED: Final[str] = "\033[41m"
         GREEN: Final[str] = "\033[42m"
@@ -107,6 +876,25 @@ class Kolyre:
         BRIGHT_CYAN: Final[str] = "\033[106m"
         BRIGHT_WHITE: Final[str] = "\033[107m"
 
+        # ASCII-encoded twins, attached by `_add_bytes_constants()`.
+        BLACK_B: ClassVar[bytes]
+        RED_B: ClassVar[bytes]
+        GREEN_B: ClassVar[bytes]
+        YELLOW_B: ClassVar[bytes]
+        BLUE_B: ClassVar[bytes]
+        MAGENTA_B: ClassVar[bytes]
+        CYAN_B: ClassVar[bytes]
+        WHITE_B: ClassVar[bytes]
+
+        BRIGHT_BLACK_B: ClassVar[bytes]
+        BRIGHT_RED_B: ClassVar[bytes]
+        BRIGHT_GREEN_B: ClassVar[bytes]
+        BRIGHT_YELLOW_B: ClassVar[bytes]
+        BRIGHT_BLUE_B: ClassVar[bytes]
+        BRIGHT_MAGENTA_B: ClassVar[bytes]
+        BRIGHT_CYAN_B: ClassVar[bytes]
+        BRIGHT_WHITE_B: ClassVar[bytes]
+
     def __init__(self) -> None:
         """Prevent instantiation of this utility class."""
         raise TypeError(
@@ -114,302 +902,16 @@ class Kolyre:
             f"and cannot be instantiated."
         )
 
-    @staticmethod
-    def _flatten(item: str | tuple[Any, ...] | list[Any]) -> list[str]:
-        """Flatten nested ANSI codes into a flat list of strings.
-
-        Args:
-            item (str | tuple[Any, ...] | list[Any]): A string or nested lists/tuples
-                of ANSI codes.
-
-        Returns:
-            list[str]: A flat list of ANSI code strings.
-
-        Raises:
-            TypeError: If an element is not a string, list, or tuple.
-        """
-        flattened: list[str] = []
-        stack: list[str | tuple[Any, ...] | list[Any]] = [item]
-        while stack:
-            current = stack.pop()
-            if isinstance(current, str):
-                flattened.append(current)
-            elif isinstance(current, (list, tuple)):
-                stack.extend(reversed(current))
-            else:
-                raise TypeError(
-                    f"ANSI code must be a string, list, or tuple of strings, "
-                    f"got {type(current).__name__}"
-                )
-
-        return flattened
-
-    @staticmethod
-    def _validate_256(color_index: int) -> int:
-        """Validate a 256-color index for ANSI escape codes.
-
-        Args:
-            color_index (int): The color index to validate.
-
-        Returns:
-            int: The validated color index.
-
-        Raises:
-            TypeError: If `color_index` is not an integer or is a boolean.
-            ValueError: If `color_index` is outside the range 0-255.
-        """
-        if isinstance(color_index, bool):
-            raise TypeError("color_index cannot be a boolean")
-
-        if not isinstance(color_index, int):
-            raise TypeError(
-                f"color_index must be an integer, got {type(color_index).__name__}"
-            )
-
-        if not 0 <= color_index <= 255:
-            raise ValueError(
-                f"color_index must be between 0 and 255, got {color_index}"
-            )
-
-        return color_index
-
-    @staticmethod
-    def _normalize_rgb(
-        rgb: str | tuple[int, int, int] | list[int] | int,
-        green: int | None,
-        blue: int | None,
-    ) -> tuple[int, int, int]:
-        """Internal helper to parse and validate RGB input formats.
-
-        Args:
-            rgb: The red component (0-255). This can also be a hex string (e.g.,
-                '#FF8800' or 'F80'), or a sequence (tuple/list) of three integers
-                (R, G, B).
-            green: The green component (0-255) if rgb is a single integer.
-            blue: The blue component (0-255) if rgb is a single integer.
-
-        Returns:
-            tuple[int, int, int]: A validated (red, green, blue) tuple of integers
-                from 0 to 255.
-
-        Raises:
-            ValueError: If any component is outside the 0-255 range, a hex string is
-                malformed, or a sequence doesn't contain exactly three values.
-            TypeError: If any component is not an integer or is a boolean, or if
-                the input type is invalid.
-        """
-        # pylint: disable=R0912
-
-        if isinstance(rgb, str):
-            hex_str = rgb.strip().lstrip("#")
-            if len(hex_str) == 3:
-                hex_str = "".join([c * 2 for c in hex_str])
-            if len(hex_str) != 6:
-                raise ValueError(
-                    f"Hex color must be 6 characters (RRGGBB), got '{hex_str}'"
-                )
-            try:
-                red = int(hex_str[0:2], 16)
-                green = int(hex_str[2:4], 16)
-                blue = int(hex_str[4:6], 16)
-            except ValueError as exc:
-                raise ValueError(f"Invalid hex color format: '{hex_str}'") from exc
-
-        elif isinstance(rgb, (tuple, list)):
-            if len(rgb) != 3:
-                raise ValueError(
-                    f"RGB sequence must have exactly 3 values, got {len(rgb)}"
-                )
-            red, green, blue = rgb
-
-        elif isinstance(rgb, int):
-            if green is None or blue is None:
-                raise ValueError(
-                    "When providing a single integer, green and blue "
-                    "must also be provided"
-                )
-            red = rgb
-        else:
-            raise TypeError(
-                "Invalid RGB input. Provide a hex string, (r, g, b), [r, g, b], or "
-                "three separate integers."
-            )
-
-        for name, value in zip(("red", "green", "blue"), (red, green, blue)):
-            if isinstance(value, bool):
-                raise TypeError(f"{name} cannot be a boolean")
-            if not isinstance(value, int):
-                raise TypeError(
-                    f"{name} must be an integer, got {type(value).__name__}"
-                )
-            if not 0 <= value <= 255:
-                raise ValueError(f"{name} must be between 0 and 255, got {value}")
-
-        return red, green, blue
-
-    @staticmethod
-    def colorize(
-        text: str,
-        *ansi_codes: str | tuple[Any, ...] | list[Any],
-        force: bool | None = None,
-    ) -> str:
-        """Apply one or more ANSI codes to the given text.
-
-        Args:
-            text (str): The text to style.
-            *ansi_codes (str | tuple[Any, ...] | list[Any]): One or more ANSI codes,
-                individually or nested in lists/tuples.
-            force (bool, optional): If True, forces styling regardless of TTY or
-                Kolyre.FORCE_COLOR setting. If None, the class-level Kolyre.FORCE_COLOR
-                is used as the override. Defaults to None.
-
-        Returns:
-            str: The styled text, reset with `Kolyre.RESET`.
-
-        Raises:
-            TypeError: If `text` is not a `str`, or if any provided ANSI code
-                is not a `str`.
-        """
-        if not isinstance(text, str):
-            raise TypeError(f"text must be a string, got {type(text).__name__}")
-        if not ansi_codes:
-            return text
-
-        codes: list[str] = []
-        for code in ansi_codes:
-            codes.extend(Kolyre._flatten(code))
-
-        if (
-            not (force if force is not None else Kolyre.FORCE_COLOR)
-            and not sys.stdout.isatty()
-        ):
-            return text
-
-        return f"{''.join(codes)}{text}{Kolyre.Style.RESET}"
-
-    @staticmethod
-    def foreground_256(color_index: int) -> str:
-        """Return a 256-color ANSI escape code for the foreground.
-
-        Args:
-            color_index (int): Integer between 0 and 255, representing a color
-                in the ANSI 256-color palette.
-
-        Returns:
-            str: ANSI escape sequence for the specified foreground color.
-
-        Raises:
-            TypeError: If `color_index` is not an integer or is a boolean.
-            ValueError: If `color_index` is outside the range 0-255.
-        """
-        validated_index = Kolyre._validate_256(color_index)
-        return f"\033[38;5;{validated_index}m"
-
-    @staticmethod
-    def background_256(color_index: int) -> str:
-        """Return a 256-color ANSI escape code for the background.
-
-        Args:
-            color_index (int): Integer between 0 and 255, representing a color
-                in the ANSI 256-color palette.
-
-        Returns:
-            str: ANSI escape sequence for the specified background color.
-
-        Raises:
-            TypeError: If `color_index` is not an integer or is a boolean.
-            ValueError: If `color_index` is outside the range 0-255.
-        """
-        validated_index = Kolyre._validate_256(color_index)
-        return f"\033[48;5;{validated_index}m"
-
-    @staticmethod
-    def foreground_rgb(
-        rgb: str | tuple[int, int, int] | list[int] | int,
-        green: int | None = None,
-        blue: int | None = None,
-    ) -> str:
-        """Return a truecolor (24-bit RGB) ANSI escape code for the foreground.
-
-        Args:
-            rgb (str, tuple, list, or int):
-                - Hex string (e.g., "#FF8800", "CC33AA", or shorthand "F80")
-                - Tuple or list of three integers (R, G, B)
-                - Single red integer if `green` and `blue` are provided
-            green (int, optional): Green value if `rgb` is a single int.
-            blue (int, optional): Blue value if `rgb` is a single int.
-
-        Returns:
-            str: ANSI escape sequence for the specified RGB foreground color.
-
-        Raises:
-            TypeError: If any component is not an integer or is a boolean.
-            ValueError: If any RGB component is outside 0-255, or if the input
-                is malformed.
-        """
-        red, green, blue = Kolyre._normalize_rgb(rgb, green, blue)
-        return f"\033[38;2;{red};{green};{blue}m"
-
-    @staticmethod
-    def background_rgb(
-        rgb: str | tuple[int, int, int] | list[int] | int,
-        green: int | None = None,
-        blue: int | None = None,
-    ) -> str:
-        """Return a truecolor (24-bit RGB) ANSI escape code for the background.
-
-        Args:
-            rgb (str, tuple, list, or int):
-                - Hex string (e.g., "#FF8800", "CC33AA", or shorthand "F80")
-                - Tuple or list of three integers (R, G, B)
-                - Single red integer if `green` and `blue` are provided
-            green (int, optional): Green value if `rgb` is a single int.
-            blue (int, optional): Blue value if `rgb` is a single int.
-
-        Returns:
-            str: ANSI escape sequence for the specified RGB background color.
-
-        Raises:
-            TypeError: If any component is not an integer or is a boolean.
-            ValueError: If any RGB component is outside 0-255, or if the input
-                is malformed.
-        """
-        red, green, blue = Kolyre._normalize_rgb(rgb, green, blue)
-        return f"\033[48;2;{red};{green};{blue}m"
-
-    @staticmethod
-    def enable_ansi_support() -> bool:
-        """Enable ANSI escape sequences on Windows terminals.
-
-        Returns:
-            bool: True if ANSI support is active or not needed; False if
-                enabling failed.
-        """
-        if sys.platform != "win32":
-            return True
-
-        try:
-            # pylint: disable=C0415
-            import ctypes
-        except ImportError:
-            return False
-
-        try:
-            std_output_handle = -11
-            enable_virtual_terminal_processing = 0x0004
-
-            handle = ctypes.windll.kernel32.GetStdHandle(std_output_handle)
-            if handle in (0, -1):
-                return False
-
-            mode = ctypes.c_uint32()
-            if not ctypes.windll.kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
-                return False
-
-            return bool(
-                ctypes.windll.kernel32.SetConsoleMode(
-                    handle, mode.value | enable_virtual_terminal_processing
-                )
-            )
-        except (AttributeError, OSError):
-            return False
+    _flatten = staticmethod(_flatten)
+    _validate_256 = staticmethod(_validate_256)
+    _normalize_rgb = staticmethod(_normalize_rgb)
+    colorize = staticmethod(colorize)
+    colorize_bytes = staticmethod(colorize_bytes)
+    invalidate_tty_cache = staticmethod(invalidate_tty_cache)
+    refresh_tty = staticmethod(refresh_tty)
+    stream = staticmethod(stream)
+    foreground_256 = staticmethod(foreground_256)
+    background_256 = staticmethod(background_256)
+    foreground_rgb = staticmethod(foreground_rgb)
+    background_rgb = staticmethod(background_rgb)
+    enable_ansi_support = staticmethod(enable_ansi_support)
@@ -7,10 +7,20 @@ text styles, and high-fidelity truecolor (RGB) gradients.
 
 import argparse
 import importlib.metadata
+import itertools
 import shutil
 import sys
+from collections.abc import Iterable
 
-from .core import Kolyre
+from .core import (
+    _BG256,
+    _FG256,
+    Kolyre,
+    background_rgb,
+    colorize,
+    enable_ansi_support,
+    foreground_rgb,
+)
 
 
 class Demo:
@@ -24,25 +34,27 @@ class Demo:
 
     @staticmethod
     def _get_constants(
-        const_class: type, exclude_keywords: list[str] | None = None
+        const_class: (
+            type[Kolyre.Style] | type[Kolyre.Foreground] | type[Kolyre.Background]
+        ),
+        exclude_names: frozenset[str] | None = None,
     ) -> list[tuple[str, str]]:
-        """Retrieve public, uppercase constants from a class.
+        """Retrieve the (name, code) constants declared by a Kolyre class.
 
         Args:
-            const_class: The class to inspect .
-            exclude_keywords: A list of substrings to filter out constants.
+            const_class: The constant class to read entries from.
+            exclude_names: Exact constant names to filter out.
 
         Returns:
-            A list of (name, value) tuples for each matching constant.
+            A list of (name, value) tuples for each matching constant, in
+            declaration order.
         """
-        if exclude_keywords is None:
-            exclude_keywords = []
+        # pylint: disable=W0212
+
+        if exclude_names is None:
+            return list(const_class._ENTRIES)
         return [
-            (name, getattr(const_class, name))
-            for name in dir(const_class)
-            if not name.startswith("_")
-            and name.isupper()
-            and not any(kw in name for kw in exclude_keywords)
+            entry for entry in const_class._ENTRIES if entry[0] not in exclude_names
         ]
 
     COLOR_CATEGORIES: dict[str, list[tuple[str, str]]] = {
@@ -53,18 +65,20 @@ class Demo:
     STYLE_CATEGORIES: dict[str, list[tuple[str, str]]] = {
         "Text Styles": _get_constants(
             Kolyre.Style,
-            exclude_keywords=[
-                "RESET",
-                "RESET_BOLD_DIM",
-                "RESET_ITALIC",
-                "RESET_UNDERLINE",
-                "RESET_REVERSED",
-                "RESET_HIDDEN",
-                "RESET_STRIKETHROUGH",
-                "RESET_OVERLINE",
-                "RESET_FOREGROUND",
-                "RESET_BACKGROUND",
-            ],
+            exclude_names=frozenset(
+                {
+                    "RESET",
+                    "RESET_BOLD_DIM",
+                    "RESET_ITALIC",
+                    "RESET_UNDERLINE",
+                    "RESET_REVERSED",
+                    "RESET_HIDDEN",
+                    "RESET_STRIKETHROUGH",
+                    "RESET_OVERLINE",
+                    "RESET_FOREGROUND",
+                    "RESET_BACKGROUND",
+                }
+            ),
         )
     }
 
@@ -72,6 +86,8 @@ class Demo:
     def _get_terminal_width() -> int:
         """Retrieve the current terminal width safely.
 
+        `run()` reads it once per demo and passes it to every section.
+
         Returns:
             int: Width of the terminal in columns.
         """
@@ -81,43 +97,73 @@ class Demo:
             return Demo.FALLBACK_TERMINAL_WIDTH
 
     @staticmethod
-    def _calculate_items_per_row(maximum_item_length: int, padding: int = 2) -> int:
+    def _calculate_items_per_row(
+        maximum_item_length: int, padding: int = 2, terminal_width: int | None = None
+    ) -> int:
         """Calculate the maximum number of items that fit in a terminal row.
 
         Args:
             maximum_item_length: The width of each item in characters.
             padding: Number of spaces between items. Defaults to 2.
+            terminal_width: Width of the terminal in columns. Queried when None.
 
         Returns:
             int: Number of items per row.
         """
-        terminal_width = Demo._get_terminal_width()
+        if terminal_width is None:
+            terminal_width = Demo._get_terminal_width()
         return max(terminal_width // (maximum_item_length + padding), 1)
 
     @staticmethod
-    def render_header(section_title: str) -> None:
+    def _write_rows(
+        cells: Iterable[str], items_per_row: int, cell_suffix: str = ""
+    ) -> None:
+        """Write pre-formatted cells to stdout with one write call per row.
+
+        Cells are consumed lazily, so only a single row is held in memory.
+
+        Args:
+            cells: The formatted cells to display, in order.
+            items_per_row: Number of cells to place on each row.
+            cell_suffix: Text appended to every cell, typically a reset code.
+                It is emitted through the row separators rather than stored in
+                each cell. Defaults to "".
+        """
+        separator = f"{cell_suffix} "
+        row_end = f"{cell_suffix}\n"
+        write = sys.stdout.write
+        cell_iterator = iter(cells)
+        while row := list(itertools.islice(cell_iterator, items_per_row)):
+            write(separator.join(row) + row_end)
+
+    @staticmethod
+    def render_header(section_title: str, terminal_width: int | None = None) -> None:
         """Render a formatted, colorized section header.
 
         Args:
             section_title: The title text of the section.
+            terminal_width: Width of the terminal in columns. Queried when None.
         """
-        header_text = f" {section_title} "
-        width = Demo._get_terminal_width()
-        print(
-            f"\n{Kolyre.colorize(header_text.center(width, '='),
-            Kolyre.Style.BOLD, Kolyre.Foreground.CYAN)}\n"
-        )
+        if terminal_width is None:
+            terminal_width = Demo._get_terminal_width()
+        header_text = f" {section_title} ".center(terminal_width, "=")
+        print(f"\n{colorize(header_text, Kolyre.Style.BOLD, Kolyre.Foreground.CYAN)}\n")
 
     @staticmethod
     def render_category_grid(
         category_mapping: dict[str, list[tuple[str, str]]],
+        terminal_width: int | None = None,
     ) -> None:
         """Render a grid display for categories of text styles or colors.
 
         Args:
             category_mapping: Mapping of category names to (display_name, ANSI_code)
                 pairs.
+            terminal_width: Width of the terminal in columns. Queried when None.
         """
+        if terminal_width is None:
+            terminal_width = Demo._get_terminal_width()
+        reset = Kolyre.Style.RESET
         for category_name, category_items in category_mapping.items():
             if not category_items:
                 continue
@@ -126,55 +172,63 @@ class Demo:
                 max(len(item_name) for item_name, _ in category_items)
                 + Demo.GRID_CELL_PADDING
             )
-            items_per_row = Demo._calculate_items_per_row(maximum_length)
-            Demo.render_header(category_name)
-
-            for index in range(0, len(category_items), items_per_row):
-                row_text = " ".join(
-                    f"{color_code}{item_name:<{maximum_length}}{Kolyre.Style.RESET}"
-                    for item_name, color_code in category_items[
-                        index : index + items_per_row
-                    ]
-                )
-                print(row_text)
+            items_per_row = Demo._calculate_items_per_row(
+                maximum_length, terminal_width=terminal_width
+            )
+            Demo.render_header(category_name, terminal_width)
+
+            cells = [
+                f"{color_code}{item_name:<{maximum_length}}"
+                for item_name, color_code in category_items
+            ]
+            Demo._write_rows(cells, items_per_row, reset)
 
     @staticmethod
-    def render_text_styles() -> None:
-        """Render all available text styles."""
-        Demo.render_category_grid(Demo.STYLE_CATEGORIES)
+    def render_text_styles(terminal_width: int | None = None) -> None:
+        """Render all available text styles.
+
+        Args:
+            terminal_width: Width of the terminal in columns. Queried when None.
+        """
+        Demo.render_category_grid(Demo.STYLE_CATEGORIES, terminal_width)
 
     @staticmethod
-    def render_16_palette() -> None:
-        """Render the 16-Color ANSI foreground and background color palette."""
-        Demo.render_category_grid(Demo.COLOR_CATEGORIES)
+    def render_16_palette(terminal_width: int | None = None) -> None:
+        """Render the 16-Color ANSI foreground and background color palette.
+
+        Args:
+            terminal_width: Width of the terminal in columns. Queried when None.
+        """
+        Demo.render_category_grid(Demo.COLOR_CATEGORIES, terminal_width)
 
     @staticmethod
-    def render_256_palette(is_foreground: bool = True) -> None:
+    def render_256_palette(
+        is_foreground: bool = True, terminal_width: int | None = None
+    ) -> None:
         """Render the full 256-color ANSI palette.
 
         Args:
             is_foreground: True for foreground, False for background.
+            terminal_width: Width of the terminal in columns. Queried when None.
         """
+        if terminal_width is None:
+            terminal_width = Demo._get_terminal_width()
         title = f"256-Color Palette ({'Foreground' if is_foreground else 'Background'})"
-        Demo.render_header(title)
-
-        items_per_row = Demo._calculate_items_per_row(4, 1)
-        for color_index in range(256):
-            color_label = f"{color_index:>3}"
-            color_code = (
-                Kolyre.foreground_256(color_index)
-                if is_foreground
-                else Kolyre.background_256(color_index)
-            )
-            print(f"{color_code}{color_label}{Kolyre.Style.RESET}", end=" ")
-            if (color_index + 1) % items_per_row == 0:
-                print()
-        if 256 % items_per_row != 0:
-            print()
+        Demo.render_header(title, terminal_width)
+
+        items_per_row = Demo._calculate_items_per_row(4, 1, terminal_width)
+        codes = _FG256 if is_foreground else _BG256
+        reset = Kolyre.Style.RESET
+        cells = [f"{code}{index:>3}" for index, code in enumerate(codes)]
+
+        Demo._write_rows(cells, items_per_row, reset)
 
     @staticmethod
     def render_rgb_gradient(
-        is_foreground: bool, rgb_step: int, display_block: str
+        is_foreground: bool,
+        rgb_step: int,
+        display_block: str,
+        terminal_width: int | None = None,
     ) -> None:
         """Render a truecolor RGB gradient demo.
 
@@ -182,30 +236,30 @@ class Demo:
             is_foreground: True for text foreground, False for background.
             rgb_step: Step size for each RGB component.
             display_block: Character or string to display in the gradient.
+            terminal_width: Width of the terminal in columns. Queried when None.
         """
+        if terminal_width is None:
+            terminal_width = Demo._get_terminal_width()
         title = (
             f"Truecolor RGB Gradient "
             f"({'Foreground' if is_foreground else 'Background'})"
         )
-        Demo.render_header(title)
-
-        items_per_row = Demo._calculate_items_per_row(len(display_block) + 1)
-        count = 0
-
-        for red_value in range(0, 256, rgb_step):
-            for green_value in range(0, 256, rgb_step):
-                for blue_value in range(0, 256, rgb_step):
-                    color_code = (
-                        Kolyre.foreground_rgb(red_value, green_value, blue_value)
-                        if is_foreground
-                        else Kolyre.background_rgb(red_value, green_value, blue_value)
-                    )
-                    print(f"{color_code}{display_block}{Kolyre.Style.RESET}", end=" ")
-                    count += 1
-                    if count % items_per_row == 0:
-                        print()
-        if count % items_per_row != 0:
-            print()
+        Demo.render_header(title, terminal_width)
+
+        items_per_row = Demo._calculate_items_per_row(
+            len(display_block) + 1, terminal_width=terminal_width
+        )
+        reset = Kolyre.Style.RESET
+        rgb_code = foreground_rgb if is_foreground else background_rgb
+        component_levels = range(0, 256, rgb_step)
+        cells = (
+            f"{rgb_code(red_value, green_value, blue_value)}{display_block}"
+            for red_value, green_value, blue_value in itertools.product(
+                component_levels, repeat=3
+            )
+        )
+
+        Demo._write_rows(cells, items_per_row, reset)
 
     @staticmethod
     def run(parsed_arguments: argparse.Namespace) -> None:
@@ -214,15 +268,17 @@ class Demo:
         Args:
             parsed_arguments (argparse.Namespace): Parsed command-line arguments.
         """
+        terminal_width = Demo._get_terminal_width()
+
         if parsed_arguments.styles:
-            Demo.render_text_styles()
+            Demo.render_text_styles(terminal_width)
 
         if parsed_arguments.palette16:
-            Demo.render_16_palette()
+            Demo.render_16_palette(terminal_width)
 
         if parsed_arguments.palette256:
-            Demo.render_256_palette(is_foreground=True)
-            Demo.render_256_palette(is_foreground=False)
+            Demo.render_256_palette(is_foreground=True, terminal_width=terminal_width)
+            Demo.render_256_palette(is_foreground=False, terminal_width=terminal_width)
 
         if parsed_arguments.rgb:
             foreground_block = (
@@ -233,10 +289,16 @@ class Demo:
             )
             rgb_step = parsed_arguments.rgb_step
             Demo.render_rgb_gradient(
-                is_foreground=True, rgb_step=rgb_step, display_block=foreground_block
+                is_foreground=True,
+                rgb_step=rgb_step,
+                display_block=foreground_block,
+                terminal_width=terminal_width,
             )
             Demo.render_rgb_gradient(
-                is_foreground=False, rgb_step=rgb_step, display_block=background_block
+                is_foreground=False,
+                rgb_step=rgb_step,
+                display_block=background_block,
+                terminal_width=terminal_width,
             )
 
 
@@ -252,7 +314,7 @@ def show_version(parsed_arguments: argparse.Namespace, ansi_supported: bool) ->
     try:
         version = importlib.metadata.version("kolyre")
         message = f"Kolyre {version}"
-        styled = Kolyre.colorize(
+        styled = colorize(
             message,
             Kolyre.Style.BOLD,
             Kolyre.Foreground.BRIGHT_GREEN
@@ -290,7 +352,7 @@ def validate_rgb_flags(
             f"These options require '--rgb': {', '.join(flags_used)}"
         )
         print(
-            Kolyre.colorize(error_msg, Kolyre.Style.BOLD, Kolyre.Foreground.RED)
+            colorize(error_msg, Kolyre.Style.BOLD, Kolyre.Foreground.RED)
             if ansi_supported
             else error_msg
         )
@@ -375,7 +437,7 @@ def main() -> None:
     )
 
     args = parser.parse_args()
-    ansi_supported = Kolyre.enable_ansi_support()
+    ansi_supported = enable_ansi_support()
 
     if args.force:
         Kolyre.FORCE_COLOR = True
@@ -396,7 +458,7 @@ def main() -> None:
     if args.rgb and not 1 <= args.rgb_step <= 255:
         error_msg = "Invalid --rgb-step value. Must be between 1 and 255."
         print(
-            Kolyre.colorize(error_msg, Kolyre.Style.BOLD, Kolyre.Foreground.RED)
+            colorize(error_msg, Kolyre.Style.BOLD, Kolyre.Foreground.RED)
             if ansi_supported
             else error_msg
         )
@@ -404,7 +466,7 @@ def main() -> None:
 
     if ansi_supported:
         print(
-            Kolyre.colorize(
+            colorize(
                 "ANSI terminal support enabled.",
                 Kolyre.Style.BOLD,
                 Kolyre.Foreground.BRIGHT_GREEN,
@@ -412,7 +474,7 @@ def main() -> None:
         )
     elif args.force:
         print(
-            Kolyre.colorize(
+            colorize(
                 "Continuing with --force.",
                 Kolyre.Style.BOLD,
                 Kolyre.Foreground.BRIGHT_YELLOW,
@@ -0,0 +1,21 @@
+"""Shared pytest fixtures for the Kolyre test suite."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from kolyre import Kolyre, core
+
+
+@pytest.fixture(autouse=True)
+def reset_tty_cache() -> Iterator[None]:
+    """Ensure every test starts and ends without a cached TTY state."""
+    Kolyre.invalidate_tty_cache()
+    yield
+    Kolyre.invalidate_tty_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_ansi_support(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure every test starts without a memoized ANSI support result."""
+    monkeypatch.setattr(core, "_ANSI_SUPPORT_RESULT", None)
@@ -0,0 +1,26 @@
+"""Tests for Kolyre's package-level functions and their class aliases."""
+
+import pytest
+
+import kolyre
+from kolyre import Kolyre
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "colorize",
+        "colorize_bytes",
+        "invalidate_tty_cache",
+        "refresh_tty",
+        "stream",
+        "foreground_256",
+        "background_256",
+        "foreground_rgb",
+        "background_rgb",
+        "enable_ansi_support",
+    ],
+)
+def test_methods_alias_module_functions(name: str) -> None:
+    """Verify that Kolyre methods are the package-level functions."""
+    assert getattr(Kolyre, name) is getattr(kolyre, name)
@@ -1,15 +1,17 @@
 """Tests for Kolyre's 256-color and RGB color functions."""
 
+from enum import IntEnum
+from typing import NamedTuple
+
 import pytest
 
 from kolyre import Kolyre
 
 
-def test_foreground_256_valid_inputs() -> None:
-    """Foreground 256-color codes should map correctly for valid inputs."""
-    assert Kolyre.foreground_256(0) == "\033[38;5;0m"
-    assert Kolyre.foreground_256(255) == "\033[38;5;255m"
-    assert Kolyre.foreground_256(42) == "\033[38;5;42m"
+@pytest.mark.parametrize("color_index", range(256))
+def test_foreground_256_valid_inputs(color_index: int) -> None:
+    """Foreground 256-color codes should map correctly for every valid index."""
+    assert Kolyre.foreground_256(color_index) == f"\033[38;5;{color_index}m"
 
 
 def test_foreground_256_invalid_inputs() -> None:
@@ -24,11 +26,22 @@ def test_foreground_256_invalid_inputs() -> None:
         Kolyre.foreground_256(256)
 
 
-def test_background_256_valid_inputs() -> None:
-    """Background 256-color codes should map correctly for valid inputs."""
-    assert Kolyre.background_256(0) == "\033[48;5;0m"
-    assert Kolyre.background_256(255) == "\033[48;5;255m"
-    assert Kolyre.background_256(100) == "\033[48;5;100m"
+def test_256_accepts_int_subclasses() -> None:
+    """256-color helpers should accept int subclasses such as IntEnum members."""
+
+    class Palette(IntEnum):
+        """Sample palette indices."""
+
+        ORANGE = 208
+
+    assert Kolyre.foreground_256(Palette.ORANGE) == "\033[38;5;208m"
+    assert Kolyre.background_256(Palette.ORANGE) == "\033[48;5;208m"
+
+
+@pytest.mark.parametrize("color_index", range(256))
+def test_background_256_valid_inputs(color_index: int) -> None:
+    """Background 256-color codes should map correctly for every valid index."""
+    assert Kolyre.background_256(color_index) == f"\033[48;5;{color_index}m"
 
 
 def test_background_256_invalid_inputs() -> None:
@@ -72,10 +85,14 @@ def test_foreground_rgb_invalid_inputs() -> None:
         Kolyre.foreground_rgb((1, "2", 3))  # type: ignore[arg-type]
     with pytest.raises(ValueError, match="must be between 0 and 255"):
         Kolyre.foreground_rgb((1, 2, 300))
+    with pytest.raises(ValueError, match="red must be between 0 and 255"):
+        Kolyre.foreground_rgb(-1, 2, 3)
     with pytest.raises(ValueError, match="green and blue must also be provided"):
         Kolyre.foreground_rgb(10)
     with pytest.raises(ValueError, match="Invalid hex color format"):
         Kolyre.foreground_rgb("GGGGGG")
+    with pytest.raises(ValueError, match="Invalid hex color format: 'GGGG00'"):
+        Kolyre.foreground_rgb("GG0")
     with pytest.raises(ValueError, match="Hex color must be 6 characters"):
         Kolyre.foreground_rgb("1234")
 
@@ -113,3 +130,34 @@ def test_background_rgb_invalid_inputs() -> None:
         Kolyre.background_rgb("FF00GG")
     with pytest.raises(ValueError, match="Hex color must be 6 characters"):
         Kolyre.background_rgb("12345")
+
+
+def test_rgb_hex_rejects_embedded_non_hex_characters() -> None:
+    """Hex strings containing signs or inner whitespace should be rejected."""
+    with pytest.raises(ValueError, match="Invalid hex color format"):
+        Kolyre.foreground_rgb("-10000")
+    with pytest.raises(ValueError, match="Invalid hex color format"):
+        Kolyre.background_rgb("FF  00")
+
+
+def test_rgb_accepts_subclassed_inputs() -> None:
+    """RGB helpers should accept named tuples and int subclasses."""
+
+    class Color(NamedTuple):
+        """Sample RGB named tuple."""
+
+        red: int
+        green: int
+        blue: int
+
+    class Level(IntEnum):
+        """Sample channel level."""
+
+        FULL = 255
+
+    assert Kolyre.foreground_rgb(Color(1, 2, 3)) == "\033[38;2;1;2;3m"
+    assert Kolyre.background_rgb(Level.FULL, 0, 0) == "\033[48;2;255;0;0m"
+    with pytest.raises(TypeError, match="red cannot be a boolean"):
+        Kolyre.foreground_rgb(True, 0, 0)
+    with pytest.raises(TypeError, match="Invalid RGB input"):
+        Kolyre.foreground_rgb(1.5)  # type: ignore[arg-type]
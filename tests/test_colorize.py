@@ -1,12 +1,21 @@
 """Tests for the primary Kolyre.colorize function and helpers."""
 
+import io
 import sys
+import types
+from typing import Any
 
 import pytest
 
 from kolyre import Kolyre
 
 
+@pytest.fixture
+def force_color(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Force colored output regardless of the TTY state."""
+    monkeypatch.setattr(Kolyre, "FORCE_COLOR", True)
+
+
 def test_colorize_applies_styles_when_tty(monkeypatch: pytest.MonkeyPatch) -> None:
     """Colorize should wrap text with codes when stdout is a TTY."""
     monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
@@ -16,18 +25,24 @@ def test_colorize_applies_styles_when_tty(monkeypatch: pytest.MonkeyPatch) -> No
     )
 
 
-def test_colorize_with_no_codes_returns_original_text(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+@pytest.mark.usefixtures("force_color")
+def test_colorize_with_no_codes_returns_original_text() -> None:
     """Colorize should return the original text if no codes are provided."""
-    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
     assert Kolyre.colorize("nothing to see") == "nothing to see"
     assert Kolyre.colorize("") == ""
 
 
-def test_colorize_with_deeply_nested_codes(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.usefixtures("force_color")
+def test_colorize_with_empty_codes_returns_original_text() -> None:
+    """Colorize should not add a reset when all codes flatten to nothing."""
+    assert Kolyre.colorize("empty", ()) == "empty"
+    assert Kolyre.colorize("empty", [(), []]) == "empty"
+    assert Kolyre.colorize("empty", "", "") == "empty"
+
+
+@pytest.mark.usefixtures("force_color")
+def test_colorize_with_deeply_nested_codes() -> None:
     """Colorize should correctly flatten deeply nested code sequences."""
-    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
     codes = (Kolyre.Style.BOLD, [Kolyre.Foreground.RED, (Kolyre.Background.BLUE,)])
     result = Kolyre.colorize("nested", codes)
     expected = (
@@ -37,6 +52,16 @@ def test_colorize_with_deeply_nested_codes(monkeypatch: pytest.MonkeyPatch) -> N
     assert result == expected
 
 
+@pytest.mark.usefixtures("force_color")
+def test_colorize_with_repeated_nested_tuples() -> None:
+    """Colorize should give the same result for repeated nested tuple codes."""
+    codes = (Kolyre.Style.BOLD, (Kolyre.Foreground.RED,))
+    expected = f"{Kolyre.Style.BOLD}{Kolyre.Foreground.RED}again{Kolyre.Style.RESET}"
+    assert Kolyre.colorize("again", codes) == expected
+    assert Kolyre.colorize("again", codes) == expected
+    assert Kolyre.colorize("again", ((), ("",))) == "again"
+
+
 def test_colorize_force_applies_styles(monkeypatch: pytest.MonkeyPatch) -> None:
     """Colorize should apply styles with force=True even if not TTY."""
     monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
@@ -56,13 +81,15 @@ def test_colorize_returns_plain_when_not_tty(monkeypatch: pytest.MonkeyPatch) ->
     assert result == "plain"
 
 
-def test_colorize_type_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.usefixtures("force_color")
+def test_colorize_type_errors() -> None:
     """Colorize should raise TypeError on invalid argument types."""
-    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
     with pytest.raises(TypeError):
         Kolyre.colorize(123, Kolyre.Foreground.RED)  # type: ignore[arg-type]
     with pytest.raises(TypeError):
         Kolyre.colorize("ok", 42)  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        Kolyre.colorize("ok", (Kolyre.Style.BOLD, 42))
 
 
 def test_colorize_uses_force_color_attribute(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -82,9 +109,9 @@ def test_colorize_uses_force_color_attribute(monkeypatch: pytest.MonkeyPatch) ->
         Kolyre.FORCE_COLOR = original_force_color
 
 
-def test_colorize_with_single_list(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.usefixtures("force_color")
+def test_colorize_with_single_list() -> None:
     """Colorize should handle a single list of codes."""
-    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
     codes = [Kolyre.Foreground.RED, Kolyre.Style.BOLD]
     result = Kolyre.colorize("list", codes)
     assert (
@@ -92,9 +119,9 @@ def test_colorize_with_single_list(monkeypatch: pytest.MonkeyPatch) -> None:
     )
 
 
-def test_colorize_with_tuple(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.usefixtures("force_color")
+def test_colorize_with_tuple() -> None:
     """Colorize should handle a tuple of codes."""
-    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
     codes = (Kolyre.Foreground.GREEN, Kolyre.Style.UNDERLINE)
     result = Kolyre.colorize("tuple", codes)
     assert (
@@ -103,9 +130,9 @@ def test_colorize_with_tuple(monkeypatch: pytest.MonkeyPatch) -> None:
     )
 
 
-def test_colorize_with_multiple_lists(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.usefixtures("force_color")
+def test_colorize_with_multiple_lists() -> None:
     """Colorize should flatten and apply multiple lists of codes."""
-    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
     codes1 = [Kolyre.Foreground.RED]
     codes2 = [Kolyre.Style.BOLD]
     result = Kolyre.colorize("lists", codes1, codes2)
@@ -114,11 +141,162 @@ def test_colorize_with_multiple_lists(monkeypatch: pytest.MonkeyPatch) -> None:
     )
 
 
-def test_colorize_with_mixed_list_and_string(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.usefixtures("force_color")
+def test_colorize_with_mixed_list_and_string() -> None:
     """Colorize should handle mixed list and string codes."""
-    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
     codes = [Kolyre.Foreground.RED]
     result = Kolyre.colorize("mixed", codes, Kolyre.Style.BOLD)
     assert (
         result == f"{Kolyre.Foreground.RED}{Kolyre.Style.BOLD}mixed{Kolyre.Style.RESET}"
     )
+
+
+@pytest.mark.usefixtures("force_color")
+def test_colorize_with_str_and_list_subclasses() -> None:
+    """Colorize should accept subclasses of str and list as codes."""
+
+    class Code(str):
+        """A str subclass standing in for a user-defined code type."""
+
+    class Codes(list[Any]):
+        """A list subclass standing in for a user-defined code container."""
+
+    codes = Codes([Code(Kolyre.Foreground.RED), [Code(Kolyre.Style.BOLD)]])
+    result = Kolyre.colorize("subclass", codes)
+    assert (
+        result
+        == f"{Kolyre.Foreground.RED}{Kolyre.Style.BOLD}subclass{Kolyre.Style.RESET}"
+    )
+
+
+def test_colorize_caches_tty_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Colorize should query isatty() once until the cache is invalidated."""
+    calls: list[None] = []
+
+    def fake_isatty() -> bool:
+        calls.append(None)
+        return True
+
+    monkeypatch.setattr(sys.stdout, "isatty", fake_isatty)
+    Kolyre.colorize("one", Kolyre.Foreground.RED)
+    Kolyre.colorize("two", Kolyre.Foreground.RED)
+    assert len(calls) == 1
+
+    Kolyre.invalidate_tty_cache()
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+    assert Kolyre.colorize("three", Kolyre.Foreground.RED) == "three"
+
+
+def test_refresh_tty_updates_cached_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Refresh_tty should re-query isatty() and return the new state."""
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    assert Kolyre.refresh_tty() is True
+    assert Kolyre.colorize("tty", Kolyre.Style.BOLD) != "tty"
+
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+    assert Kolyre.refresh_tty() is False
+    assert Kolyre.colorize("plain", Kolyre.Style.BOLD) == "plain"
+
+
+def test_colorize_rechecks_tty_when_stdout_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Colorize should re-evaluate the TTY state when sys.stdout is replaced."""
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    assert Kolyre.colorize("tty", Kolyre.Style.BOLD) != "tty"
+
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    assert Kolyre.colorize("redirected", Kolyre.Style.BOLD) == "redirected"
+
+
+@pytest.mark.usefixtures("force_color")
+def test_colorize_bytes_applies_styles() -> None:
+    """Colorize_bytes should wrap bytes with codes when stdout is a TTY."""
+    result = Kolyre.colorize_bytes(
+        b"hello", Kolyre.Style.BOLD_B, Kolyre.Foreground.RED_B
+    )
+    assert result == b"\033[1m\033[31mhello\033[0m"
+    assert Kolyre.colorize_bytes(b"plain") == b"plain"
+
+
+def test_colorize_bytes_respects_tty_and_force(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Colorize_bytes should follow the same TTY and force rules as colorize."""
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+    assert Kolyre.colorize_bytes(b"plain", b"\033[1m") == b"plain"
+    assert (
+        Kolyre.colorize_bytes(b"forced", b"\033[1m", force=True)
+        == b"\033[1mforced\033[0m"
+    )
+
+
+def test_colorize_bytes_type_errors() -> None:
+    """Colorize_bytes should reject str text and str codes."""
+    with pytest.raises(TypeError):
+        Kolyre.colorize_bytes("text", b"\033[1m")  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        Kolyre.colorize_bytes(b"text", "\033[1m")  # type: ignore[arg-type]
+
+
+@pytest.mark.usefixtures("force_color")
+def test_stream_writes_buffered_fragments_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Stream should write all styled fragments in a single call on exit."""
+    writes: list[str] = []
+    writer = io.StringIO()
+    monkeypatch.setattr(writer, "write", writes.append)
+
+    with Kolyre.stream(writer) as out:
+        out.write("a", Kolyre.Style.BOLD)
+        out.write("b")
+        out.write("c", [Kolyre.Foreground.RED], force=True)
+        assert not writes
+
+    assert writes == [
+        f"{Kolyre.Style.BOLD}a{Kolyre.Style.RESET}b"
+        f"{Kolyre.Foreground.RED}c{Kolyre.Style.RESET}"
+    ]
+
+
+def test_stream_flush_clears_buffer() -> None:
+    """Stream.flush should write pending output and skip empty buffers."""
+    writer = io.StringIO()
+    with Kolyre.stream(writer) as out:
+        out.write("first ", Kolyre.Style.BOLD)
+        out.flush()
+        assert writer.getvalue() == "first "
+        out.flush()
+    assert writer.getvalue() == "first "
+
+
+def test_stream_follows_writer_tty_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stream should style based on its writer's TTY state, not stdout's."""
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    plain_writer = io.StringIO()
+    with Kolyre.stream(plain_writer) as out:
+        out.write("plain", Kolyre.Style.BOLD)
+        out.write("forced", Kolyre.Style.BOLD, force=True)
+    assert plain_writer.getvalue() == (
+        f"plain{Kolyre.Style.BOLD}forced{Kolyre.Style.RESET}"
+    )
+
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+    Kolyre.invalidate_tty_cache()
+    tty_writer = io.StringIO()
+    monkeypatch.setattr(tty_writer, "isatty", lambda: True)
+    with Kolyre.stream(tty_writer) as out:
+        out.write("styled", Kolyre.Style.BOLD)
+    assert tty_writer.getvalue() == f"{Kolyre.Style.BOLD}styled{Kolyre.Style.RESET}"
+
+
+def test_stream_without_isatty_is_not_a_tty() -> None:
+    """Stream should treat writers without isatty() as non-TTY."""
+    fragments: list[str] = []
+    writer = types.SimpleNamespace(write=fragments.append)
+    with Kolyre.stream(writer) as out:  # type: ignore[arg-type]
+        out.write("plain", Kolyre.Style.BOLD)
+        with pytest.raises(TypeError):
+            out.write("bad", 42)  # type: ignore[arg-type]
+    assert fragments == ["plain"]
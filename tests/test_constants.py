@@ -1,5 +1,7 @@
 """Tests for Kolyre's static ANSI color and style constants."""
 
+import sys
+
 import pytest
 
 from kolyre import Kolyre
@@ -90,3 +92,23 @@ def test_foreground_constants(name: str, code: int) -> None:
 def test_background_constants(name: str, code: int) -> None:
     """Verify all 16-color background constants."""
     assert getattr(Kolyre.Background, name) == f"\033[{code}m"
+
+
+@pytest.mark.parametrize(
+    "const_class", [Kolyre.Style, Kolyre.Foreground, Kolyre.Background]
+)
+def test_bytes_constants_match_str_constants(const_class: type) -> None:
+    """Verify every constant has a declared, ASCII-encoded `_B` counterpart."""
+    for name, code in getattr(const_class, "_ENTRIES"):
+        assert f"{name}_B" in const_class.__annotations__
+        assert getattr(const_class, f"{name}_B") == code.encode("ascii")
+
+
+@pytest.mark.parametrize(
+    "const_class", [Kolyre.Style, Kolyre.Foreground, Kolyre.Background]
+)
+def test_constants_are_interned(const_class: type) -> None:
+    """Verify every constant is the interned copy of its escape code."""
+    for name, code in getattr(const_class, "_ENTRIES"):
+        assert getattr(const_class, name) is code
+        assert code is sys.intern(code)
@@ -1,13 +1,57 @@
 """Tests for Kolyre.enable_ansi_support, focusing on Windows-specific logic."""
 
 import builtins
+import io
 import sys
 import types
 from typing import Any
 
 import pytest
 
-from kolyre import Kolyre
+from kolyre import Kolyre, colorize
+
+
+class FakeKernel32:
+    """Configurable mock of the kernel32 console API."""
+
+    # pylint: disable=invalid-name
+
+    def __init__(self) -> None:
+        self.std_handle = 42
+        self.get_mode_result = True
+        self.get_mode_error: Exception | None = None
+        self.set_mode_result = True
+        self.get_std_handle_calls = 0
+
+    def GetStdHandle(self, _: Any) -> int:
+        """Mocks GetStdHandle, recording each call."""
+        self.get_std_handle_calls += 1
+        return self.std_handle
+
+    def GetConsoleMode(self, _handle: Any, mode: Any) -> bool:
+        """Mocks GetConsoleMode, setting the initial mode value."""
+        if self.get_mode_error is not None:
+            raise self.get_mode_error
+        mode.value = 0
+        return self.get_mode_result
+
+    def SetConsoleMode(self, _handle: Any, _mode: Any) -> bool:
+        """Mocks SetConsoleMode."""
+        return self.set_mode_result
+
+
+@pytest.fixture(name="fake_kernel32")
+def fixture_fake_kernel32(monkeypatch: pytest.MonkeyPatch) -> FakeKernel32:
+    """Simulate Windows with a dummy ctypes module backed by FakeKernel32."""
+    monkeypatch.setattr(sys, "platform", "win32")
+    kernel32 = FakeKernel32()
+    dummy_ctypes = types.SimpleNamespace(
+        windll=types.SimpleNamespace(kernel32=kernel32),
+        c_uint32=lambda: types.SimpleNamespace(value=0),
+        byref=lambda x: x,
+    )
+    monkeypatch.setitem(sys.modules, "ctypes", dummy_ctypes)
+    return kernel32
 
 
 def test_enable_ansi_support_non_windows(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -33,147 +77,58 @@ def test_enable_ansi_support_windows_without_ctypes(
 
 @pytest.mark.parametrize("invalid_handle", [0, -1])
 def test_enable_ansi_support_windows_get_handle_failure(
-    monkeypatch: pytest.MonkeyPatch, invalid_handle: int
+    fake_kernel32: FakeKernel32, invalid_handle: int
 ) -> None:
     """Simulate GetStdHandle returning 0 or -1 (failure indicators)."""
-    monkeypatch.setattr(sys, "platform", "win32")
-
-    class DummyKernel32:
-        """Mock Kernel32 DLL for simulating API failures."""
-
-        def GetStdHandle(self, _: Any) -> int:  # pylint: disable=invalid-name
-            """Mocks GetStdHandle."""
-            return invalid_handle
-
-        def GetConsoleMode(self, *_: Any) -> bool:  # pylint: disable=invalid-name
-            """Mocks GetConsoleMode."""
-            return True
-
-    dummy_ctypes = types.SimpleNamespace(
-        windll=types.SimpleNamespace(kernel32=DummyKernel32()),
-        c_uint32=lambda: types.SimpleNamespace(value=0),
-        byref=lambda x: x,
-    )
-    sys.modules["ctypes"] = dummy_ctypes  # type: ignore[assignment]
+    fake_kernel32.std_handle = invalid_handle
     assert Kolyre.enable_ansi_support() is False
 
 
 def test_enable_ansi_support_windows_get_mode_failure(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_kernel32: FakeKernel32,
 ) -> None:
     """Simulate GetConsoleMode returning False (API failure)."""
-    monkeypatch.setattr(sys, "platform", "win32")
-
-    class DummyKernel32:
-        """Mock Kernel32 DLL for GetConsoleMode failure."""
-
-        def GetStdHandle(self, _: Any) -> int:  # pylint: disable=invalid-name
-            """Mocks GetStdHandle."""
-            return 42
-
-        def GetConsoleMode(self, _handle: Any, _mode: Any) -> bool:  # pylint: disable=invalid-name
-            """Mocks GetConsoleMode returning False."""
-            return False
-
-        def SetConsoleMode(self, _handle: Any, _mode: Any) -> bool:  # pylint: disable=invalid-name
-            """Mocks SetConsoleMode."""
-            return True
-
-    dummy_ctypes = types.SimpleNamespace(
-        windll=types.SimpleNamespace(kernel32=DummyKernel32()),
-        c_uint32=lambda: types.SimpleNamespace(value=0),
-        byref=lambda x: x,
-    )
-    sys.modules["ctypes"] = dummy_ctypes  # type: ignore[assignment]
+    fake_kernel32.get_mode_result = False
     assert Kolyre.enable_ansi_support() is False
 
 
 def test_enable_ansi_support_windows_api_exception(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_kernel32: FakeKernel32,
 ) -> None:
     """Simulate an exception (like OSError) during Windows API calls."""
-    monkeypatch.setattr(sys, "platform", "win32")
-
-    class DummyKernel32:
-        """Mock Kernel32 DLL for simulating an exception."""
-
-        def GetStdHandle(self, _: Any) -> int:  # pylint: disable=invalid-name
-            """Mocks GetStdHandle."""
-            return 42
-
-        def GetConsoleMode(self, *_: Any) -> bool:  # pylint: disable=invalid-name
-            """Mocks GetConsoleMode raising an exception."""
-            raise OSError("Simulated API failure")
-
-        def SetConsoleMode(self, *_: Any) -> bool:  # pylint: disable=invalid-name
-            """Mocks SetConsoleMode."""
-            return True
-
-    dummy_ctypes = types.SimpleNamespace(
-        windll=types.SimpleNamespace(kernel32=DummyKernel32()),
-        c_uint32=lambda: types.SimpleNamespace(value=0),
-        byref=lambda x: x,
-    )
-    sys.modules["ctypes"] = dummy_ctypes  # type: ignore[assignment]
+    fake_kernel32.get_mode_error = OSError("Simulated API failure")
     assert Kolyre.enable_ansi_support() is False
 
 
-def test_enable_ansi_support_windows_ctypes_success(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+@pytest.mark.usefixtures("fake_kernel32")
+def test_enable_ansi_support_windows_ctypes_success() -> None:
     """Simulate a successful SetConsoleMode call, enabling ANSI."""
-    monkeypatch.setattr(sys, "platform", "win32")
-
-    class DummyKernel32:
-        """Mock Kernel32 DLL for a successful API sequence."""
-
-        def GetStdHandle(self, _: Any) -> int:  # pylint: disable=invalid-name
-            """Mocks GetStdHandle."""
-            return 42
-
-        def GetConsoleMode(self, _: Any, mode: Any) -> bool:  # pylint: disable=invalid-name
-            """Mocks GetConsoleMode, setting initial mode value."""
-            mode.value = 0
-            return True
-
-        def SetConsoleMode(self, _handle: Any, _mode: Any) -> bool:  # pylint: disable=invalid-name
-            """Mocks SetConsoleMode returning success."""
-            return True
-
-    dummy_ctypes = types.SimpleNamespace(
-        windll=types.SimpleNamespace(kernel32=DummyKernel32()),
-        c_uint32=lambda: types.SimpleNamespace(value=0),
-        byref=lambda x: x,
-    )
-    sys.modules["ctypes"] = dummy_ctypes  # type: ignore[assignment]
     assert Kolyre.enable_ansi_support() is True
 
 
 def test_enable_ansi_support_windows_ctypes_failure(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_kernel32: FakeKernel32,
 ) -> None:
     """Simulate SetConsoleMode returning False (permission/API failure)."""
-    monkeypatch.setattr(sys, "platform", "win32")
+    fake_kernel32.set_mode_result = False
+    assert Kolyre.enable_ansi_support() is False
 
-    class DummyKernel32:
-        """Mock Kernel32 DLL for SetConsoleMode failure."""
 
-        def GetStdHandle(self, _: Any) -> int:  # pylint: disable=invalid-name
-            """Mocks GetStdHandle."""
-            return 42
+def test_enable_ansi_support_memoizes_result(fake_kernel32: FakeKernel32) -> None:
+    """The console API should only be queried again when forced."""
+    assert Kolyre.enable_ansi_support() is True
+    assert Kolyre.enable_ansi_support() is True
+    assert fake_kernel32.get_std_handle_calls == 1
 
-        def GetConsoleMode(self, _handle: Any, _mode: Any) -> bool:  # pylint: disable=invalid-name
-            """Mocks GetConsoleMode returning success."""
-            return True
+    assert Kolyre.enable_ansi_support(force_refresh=True) is True
+    assert fake_kernel32.get_std_handle_calls == 2
 
-        def SetConsoleMode(self, _handle: Any, _mode: Any) -> bool:  # pylint: disable=invalid-name
-            """Mocks SetConsoleMode returning failure."""
-            return False
 
-    dummy_ctypes = types.SimpleNamespace(
-        windll=types.SimpleNamespace(kernel32=DummyKernel32()),
-        c_uint32=lambda: types.SimpleNamespace(value=0),
-        byref=lambda x: x,
-    )
-    sys.modules["ctypes"] = dummy_ctypes  # type: ignore[assignment]
-    assert Kolyre.enable_ansi_support() is False
+@pytest.mark.usefixtures("fake_kernel32")
+def test_enable_ansi_support_keeps_redirected_stdout_plain(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Enabling ANSI on Windows should not style output to a non-TTY stdout."""
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    assert Kolyre.enable_ansi_support() is True
+    assert colorize("hello", Kolyre.Foreground.RED) == "hello"